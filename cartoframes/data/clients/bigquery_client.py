@@ -1,7 +1,6 @@
 import os
 import csv
 import tqdm
-import pandas as pd
 
 from google.auth.exceptions import RefreshError
 from google.cloud import bigquery, storage, bigquery_storage_v1beta1 as bigquery_storage
@@ -102,9 +101,10 @@ class BigQueryClient:
     @timelogger
     def download_to_dataframe(self, job):
         try:
-            rows = self._download_by_bq_storage_api(job)
-            data = list(rows)
-            return pd.DataFrame(data)
+            # Arrow streams build the dataframe from columnar record batches,
+            # instead of materializing a Python dict per row
+            rows = self._download_by_bq_storage_api(job, format_=bigquery_storage.enums.DataFormat.ARROW)
+            return rows.to_dataframe()
         except Exception:
             log.debug('Cannot download using BigQuery Storage API, fallback to standard')
 
@@ -116,7 +116,7 @@ class BigQueryClient:
 
                 raise DOError('Error downloading data')
 
-    def _download_by_bq_storage_api(self, job, timeout=_BQS_TIMEOUT):
+    def _download_by_bq_storage_api(self, job, timeout=_BQS_TIMEOUT, format_=bigquery_storage.enums.DataFormat.AVRO):
         table_ref = job.destination.to_bqstorage()
 
         parent = 'projects/{}'.format(self._gcp_execution_project)
@@ -124,7 +124,7 @@ class BigQueryClient:
             table_ref,
             parent,
             requested_streams=1,
-            format_=bigquery_storage.enums.DataFormat.AVRO,
+            format_=format_,
             # We use a LIQUID strategy because we only read from a
             # single stream. Consider BALANCED if requested_streams > 1
             sharding_strategy=(bigquery_storage.enums.ShardingStrategy.LIQUID)
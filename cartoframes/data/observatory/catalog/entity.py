@@ -91,6 +91,12 @@ class CatalogEntity(ABC):
         return {key: value for key, value in self.data.items() if key not in self.export_excluded_fields}
 
     def __eq__(self, other):
+        if self is other:
+            return True
+
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+
         return self.data == other.data
 
     def __ne__(self, other):
@@ -121,10 +127,6 @@ class CatalogEntity(ABC):
             bq_client.bq_public_project
         )
 
-        project, dataset, table = full_remote_table_name.split('.')
-
-        column_names = bq_client.get_table_column_names(project, dataset, table)
-
         query = 'SELECT * FROM `{}`'.format(full_remote_table_name)
         if limit:
             query = '{} LIMIT {}'.format(query, limit)
@@ -132,6 +134,11 @@ class CatalogEntity(ABC):
         job = bq_client.query(query)
 
         if file_path:
+            # The column names are only needed for the CSV header, so the
+            # table metadata is fetched just for file downloads
+            project, dataset, table = full_remote_table_name.split('.')
+            column_names = bq_client.get_table_column_names(project, dataset, table)
+
             bq_client.download_to_file(job, file_path, column_names=column_names)
             log.info('Data saved: {}.'.format(file_path))
             log.info("To read it you can do: `pandas.read_csv('{}')`.".format(file_path))
@@ -159,7 +166,7 @@ def _get_bigquery_client(credentials):
 
 
 def is_slug_value(id_value):
-    return len(id_value.split('.')) == 1
+    return '.' not in id_value
 
 
 class CatalogList(list):
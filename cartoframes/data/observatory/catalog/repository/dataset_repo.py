@@ -16,6 +16,16 @@ class DatasetRepository(EntityRepository):
 
     def __init__(self):
         super(DatasetRepository, self).__init__(_DATASET_ID_FIELD, _ALLOWED_FILTERS, _DATASET_SLUG_FIELD)
+        self._cached_entities = {}
+
+    def get_by_id(self, entity_id):
+        # An enrichment resolves the same dataset once per variable, so
+        # repeated lookups are served from memory instead of one
+        # catalog round-trip each
+        if entity_id not in self._cached_entities:
+            self._cached_entities[entity_id] = super(DatasetRepository, self).get_by_id(entity_id)
+
+        return self._cached_entities[entity_id]
 
     def get_all(self, filters=None, credentials=None):
         self.client.set_user_credentials(credentials)
@@ -55,7 +55,8 @@ class EntityRepository(ABC):
         if len(rows) == 0:
             return None
 
-        normalized_data = [self._get_entity_class()(self._map_row(row)) for row in rows]
+        entity_class = self._get_entity_class()
+        normalized_data = [entity_class(self._map_row(row)) for row in rows]
         return CatalogList(normalized_data)
 
     def _get_filters(self, filters):
@@ -21,6 +21,15 @@ class GeographyRepository(EntityRepository):
 
     def __init__(self):
         super(GeographyRepository, self).__init__(_GEOGRAPHY_ID_FIELD, _ALLOWED_FILTERS, _GEOGRAPHY_SLUG_FIELD)
+        self._cached_entities = {}
+
+    def get_by_id(self, entity_id):
+        # Geographies are immutable catalog metadata, so repeated lookups
+        # (e.g. one per variable during an enrichment) are served from memory
+        if entity_id not in self._cached_entities:
+            self._cached_entities[entity_id] = super(GeographyRepository, self).get_by_id(entity_id)
+
+        return self._cached_entities[entity_id]
 
     def get_all(self, filters=None, credentials=None):
         self.client.set_user_credentials(credentials)
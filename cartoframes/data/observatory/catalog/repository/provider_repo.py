@@ -12,6 +12,15 @@ class ProviderRepository(EntityRepository):
 
     def __init__(self):
         super(ProviderRepository, self).__init__(_PROVIDER_ID_FIELD, [])
+        self._cached_entities = {}
+
+    def get_by_id(self, entity_id):
+        # Providers are immutable catalog metadata, so repeated lookups
+        # are served from memory instead of re-querying the catalog
+        if entity_id not in self._cached_entities:
+            self._cached_entities[entity_id] = super(ProviderRepository, self).get_by_id(entity_id)
+
+        return self._cached_entities[entity_id]
 
     @classmethod
     def _get_entity_class(cls):
@@ -8,9 +8,12 @@ class RepoClient:
     __instance = None
 
     def __init__(self):
-        self._user_credentials = None
-        self._do_credentials = Credentials('do-metadata', 'default_public')
-        self._context_manager = ContextManager(self._do_credentials)
+        # __new__ always returns the singleton, so guard against re-running
+        # the initialization (and rebuilding the context manager) on every call
+        if not hasattr(self, '_context_manager'):
+            self._user_credentials = None
+            self._do_credentials = Credentials('do-metadata', 'default_public')
+            self._context_manager = ContextManager(self._do_credentials)
 
     def set_user_credentials(self, credentials):
         self._user_credentials = credentials
@@ -82,14 +85,14 @@ class RepoClient:
         conditions = extra_conditions or []
 
         if filters is not None and len(filters) > 0:
-            conditions.extend([self._generate_condition(key, value) for key, value in sorted(filters.items())])
+            conditions.extend(self._generate_condition(key, value) for key, value in sorted(filters.items()))
 
         return conditions
 
     @staticmethod
     def _generate_condition(key, value):
         if isinstance(value, list):
-            value_list = ','.join(["'" + v + "'" for v in value])
+            value_list = ','.join("'" + v + "'" for v in value)
             return "t.{} IN ({})".format(key, value_list)
 
         return "t.{} = '{}'".format(key, value)
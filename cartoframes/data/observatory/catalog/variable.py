@@ -93,18 +93,15 @@ class Variable(CatalogEntity):
 
     @property
     def project_name(self):
-        project, _, _, _ = self.id.split('.')
-        return project
+        return self.id.partition('.')[0]
 
     @property
     def schema_name(self):
-        _, schema, _, _ = self.id.split('.')
-        return schema
+        return self.id.split('.', 2)[1]
 
     @property
     def dataset_name(self):
-        _, _, dataset, _ = self.id.split('.')
-        return dataset
+        return self.id.split('.', 3)[2]
 
     def describe(self):
         """Shows a summary of the actual stats of the variable (column) of the dataset.
@@ -1,6 +1,8 @@
 import uuid
 import time
 
+import numpy as np
+
 from geopandas import GeoDataFrame
 from collections import defaultdict
 
@@ -82,7 +84,7 @@ class EnrichmentService(object):
                              'a valid geometry or specify the "geom_col" param with a geometry column.')
 
         # Add extra columns for the enrichment
-        geodataframe[_ENRICHMENT_ID] = range(geodataframe.shape[0])
+        geodataframe[_ENRICHMENT_ID] = np.arange(geodataframe.shape[0])
         geodataframe[_GEOM_COLUMN] = geodataframe.geometry.apply(to_geojson)
 
         return geodataframe
@@ -200,7 +200,7 @@ class Isolines(Service):
         if exclusive:
             # Add range label column
             if len(gdf) > 0:
-                gdf[RANGE_LABEL_KEY] = gdf.apply(lambda r: '%.0f min.' % (r[DATA_RANGE_KEY]/60), axis=1)
+                gdf[RANGE_LABEL_KEY] = (gdf[DATA_RANGE_KEY] / 60).map('%.0f min.'.__mod__)
 
         if table_name:
             # save result in a table
@@ -1,5 +1,6 @@
 import time
 
+from functools import lru_cache
 from pandas import read_csv
 from warnings import warn
 
@@ -13,11 +14,19 @@ from ...auth.defaults import get_default_credentials
 from ...utils.logger import log
 from ...utils.geom_utils import encode_geometry_ewkb
 from ...utils.utils import is_sql_query, check_credentials, encode_row, map_geom_type, PG_NULL
-from ...utils.columns import Column, get_dataframe_columns_info, obtain_converters, \
-                      date_columns_names, normalize_name
+from ...utils.columns import Column, get_dataframe_columns_info, obtain_converters, obtain_na_values, \
+                      date_columns_names, geom_columns_names, normalize_name
 
 DEFAULT_RETRY_TIMES = 3
 
+COPY_CHUNK_SIZE = 1 << 20  # bytes of CSV accumulated per COPY FROM write
+
+# The fixed parts of the COPY queries, with the NULL marker already
+# interpolated, so each call only fills in the variable pieces
+_COPY_TO_QUERY_TMPL = 'COPY ({query}) TO stdout WITH (FORMAT csv, HEADER true, NULL \'' + PG_NULL + '\')'
+_COPY_FROM_QUERY_TMPL = \
+    'COPY {table_name}({columns}) FROM stdin WITH (FORMAT csv, DELIMITER \'|\', NULL \'' + PG_NULL + '\');'
+
 
 class ContextManager:
 
@@ -30,6 +39,8 @@ class ContextManager:
         self.copy_client = CopySQLClient(self.auth_client)
         self.batch_sql_client = BatchSQLClient(self.auth_client)
 
+        self._schema = None
+
     def execute_query(self, query, parse_json=True, do_post=True, format=None, **request_args):
         return self.sql_client.send(query.strip(), parse_json, do_post, format, **request_args)
 
@@ -117,17 +128,23 @@ class ContextManager:
         return DatasetInfo(self.auth_client, table_name).privacy
 
     def get_schema(self):
-        """Get user schema from current credentials"""
-        query = 'SELECT current_schema()'
-        result = self.execute_query(query, do_post=False)
-        return result['rows'][0]['current_schema']
+        """Get user schema from current credentials.
+        The schema is tied to the credentials, so it is fetched once
+        per instance and cached."""
+        if self._schema is None:
+            query = 'SELECT current_schema()'
+            result = self.execute_query(query, do_post=False)
+            self._schema = result['rows'][0]['current_schema']
+        return self._schema
 
     def get_geom_type(self, query):
         """Fetch geom type of a remote table or query"""
+        # Only the first distinct value is read from the response, so the
+        # server can stop as soon as it finds one
         distict_query = '''
             SELECT distinct ST_GeometryType(the_geom) AS geom_type
             FROM ({}) q
-            LIMIT 5
+            LIMIT 1
         '''.format(query)
         response = self.execute_query(distict_query, do_post=False)
         if response and response.get('rows') and len(response.get('rows')) > 0:
@@ -184,7 +201,7 @@ class ContextManager:
         tables = []
         if result['total_rows'] > 0 and result['rows'][0]['tables']:
             # Dataset_info only works with tables without schema
-            tables = [table.split('.')[1] if '.' in table else table for table in result['rows'][0]['tables']]
+            tables = [table.rpartition('.')[2] for table in result['rows'][0]['tables']]
         return tables
 
     def _create_table_from_query(self, query, table_name, schema, cartodbfy=True):
@@ -229,12 +246,9 @@ class ContextManager:
         return Column.from_sql_api_fields(table_info['fields'])
 
     def _get_copy_query(self, query, columns, limit):
-        query_columns = [
-            column.name for column in columns if (column.name != 'the_geom_webmercator')]
-
         query = 'SELECT {columns} FROM ({query}) _q'.format(
             query=query,
-            columns=','.join(query_columns))
+            columns=_join_copy_columns(tuple(column.name for column in columns)))
 
         if limit is not None:
             if isinstance(limit, int) and (limit >= 0):
@@ -245,38 +259,47 @@ class ContextManager:
         return query
 
     def _copy_to(self, query, columns, retry_times):
-        copy_query = 'COPY ({0}) TO stdout WITH (FORMAT csv, HEADER true, NULL \'{1}\')'.format(query, PG_NULL)
-
-        try:
-            raw_result = self.copy_client.copyto_stream(copy_query)
-        except CartoRateLimitException as err:
-            if retry_times > 0:
-                retry_times -= 1
-                warn('Read call rate limited. Waiting {s} seconds'.format(s=err.retry_after))
-                time.sleep(err.retry_after)
-                warn('Retrying...')
-                return self._copy_to(query, columns, retry_times)
-            else:
-                warn(('Read call was rate-limited. '
-                      'This usually happens when there are multiple queries being read at the same time.'))
-                raise err
+        copy_query = _COPY_TO_QUERY_TMPL.format(query=query)
+
+        while True:
+            try:
+                raw_result = self.copy_client.copyto_stream(copy_query)
+                break
+            except CartoRateLimitException as err:
+                if retry_times > 0:
+                    retry_times -= 1
+                    warn('Read call rate limited. Waiting {s} seconds'.format(s=err.retry_after))
+                    time.sleep(err.retry_after)
+                    warn('Retrying...')
+                else:
+                    warn(('Read call was rate-limited. '
+                          'This usually happens when there are multiple queries being read at the same time.'))
+                    raise err
 
         converters = obtain_converters(columns)
         parse_dates = date_columns_names(columns)
+        na_values = obtain_na_values(columns)
 
         df = read_csv(
             raw_result,
             converters=converters,
-            parse_dates=parse_dates)
+            parse_dates=parse_dates,
+            na_values=na_values,
+            keep_default_na=False)
+
+        # Missing geometries are parsed as NaN; decode_geometry expects
+        # None, so they are replaced before the column reaches it
+        for geom_column_name in geom_columns_names(columns):
+            if geom_column_name in df:
+                geom_column = df[geom_column_name]
+                df[geom_column_name] = geom_column.astype(object).where(geom_column.notnull(), None)
 
         return df
 
     def _copy_from(self, dataframe, table_name, columns):
-        query = """
-            COPY {table_name}({columns}) FROM stdin WITH (FORMAT csv, DELIMITER '|', NULL '{null}');
-        """.format(
-            table_name=table_name, null=PG_NULL,
-            columns=','.join(column.dbname for column in columns)).strip()
+        query = _COPY_FROM_QUERY_TMPL.format(
+            table_name=table_name,
+            columns=','.join(column.dbname for column in columns))
         data = _compute_copy_data(dataframe, columns)
         self.copy_client.copyfrom(query, data)
 
@@ -291,6 +314,13 @@ class ContextManager:
         return norm_table_name
 
 
+@lru_cache(maxsize=128)
+def _join_copy_columns(column_names):
+    # Memoized so polling the same source repeatedly reuses the joined
+    # column list instead of rebuilding it on every download
+    return ','.join(name for name in column_names if name != 'the_geom_webmercator')
+
+
 def _drop_table_query(table_name, if_exists=True):
     return '''DROP TABLE {if_exists} {table_name}'''.format(
         table_name=table_name,
@@ -330,17 +360,31 @@ def _create_auth_client(credentials, public=False):
 
 
 def _compute_copy_data(df, columns):
-    for index, _ in df.iterrows():
-        row_data = []
-        for column in columns:
-            val = df.at[index, column.name]
-
-            if column.is_geom:
-                val = encode_geometry_ewkb(val)
-
-            row_data.append(encode_row(val))
-
-        csv_row = b'|'.join(row_data)
-        csv_row += b'\n'
-
-        yield csv_row
+    # Iterate column arrays zipped together instead of iterrows, which
+    # builds a Series and pays a scalar df.at lookup per cell.
+    # Geometry columns are encoded to EWKB in one batch up front, so the
+    # row loop only deals with ready values. The encoded values are kept
+    # in plain lists: re-materializing them through pandas would let its
+    # dtype inference rewrite the None of null geometries into NaN
+    column_values = [
+        [encode_geometry_ewkb(value) for value in df[column.name]]
+        if column.is_geom else df[column.name].to_numpy()
+        for column in columns
+    ]
+
+    # Rows are accumulated into ~1 MiB blocks so each write to the COPY
+    # socket moves a large buffer instead of one small bytes object per row
+    buffer = bytearray()
+
+    for values in zip(*column_values):
+        row_data = [encode_row(val) for val in values]
+
+        buffer += b'|'.join(row_data)
+        buffer += b'\n'
+
+        if len(buffer) >= COPY_CHUNK_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+
+    if buffer:
+        yield bytes(buffer)
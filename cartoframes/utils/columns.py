@@ -182,27 +182,35 @@ def normalize_name(column_name):
 
 
 def obtain_converters(columns):
+    # Only boolean columns need a Python-level converter ('t'/'f' values).
+    # Numeric and object columns are parsed by the C tokenizer directly,
+    # with nulls handled via na_values in the read_csv call
     converters = {}
 
-    for int_column_name in int_columns_names(columns):
-        converters[int_column_name] = _convert_int
-
-    for float_column_name in float_columns_names(columns):
-        converters[float_column_name] = _convert_float
-
     for bool_column_name in bool_columns_names(columns):
         converters[bool_column_name] = _convert_bool
 
-    for object_column_name in object_columns_names(columns):
-        converters[object_column_name] = _convert_object
-
     return converters
 
 
+def obtain_na_values(columns):
+    # The NULL marker means missing for every column; float columns must
+    # also treat the literal NaN emitted by PostgreSQL as missing, while
+    # text columns keep it as a regular value
+    return {
+        x.name: [PG_NULL, 'NaN'] if x.dtype in Column.FLOAT_DTYPES else [PG_NULL]
+        for x in columns
+    }
+
+
 def date_columns_names(columns):
     return [x.name for x in columns if x.dtype in Column.DATETIME_DTYPES]
 
 
+def geom_columns_names(columns):
+    return [x.name for x in columns if x.pgtype == 'geometry']
+
+
 def int_columns_names(columns):
     return [x.name for x in columns if x.dtype in Column.INT_DTYPES]
 
@@ -219,18 +227,6 @@ def object_columns_names(columns):
     return [x.name for x in columns if x.dtype == Column.OBJECT_DTYPE]
 
 
-def _convert_int(x):
-    if _is_none_null(x):
-        return None
-    return int(x)
-
-
-def _convert_float(x):
-    if _is_none_null(x):
-        return None
-    return float(x)
-
-
 def _convert_bool(x):
     if _is_none_null(x):
         return None
@@ -241,12 +237,6 @@ def _convert_bool(x):
     return bool(x)
 
 
-def _convert_object(x):
-    if _is_none_null(x):
-        return None
-    return x
-
-
 def _is_none_null(x):
     return x is None or x == PG_NULL
 
@@ -5,6 +5,14 @@ import binascii as ba
 
 from geopandas import GeoSeries, GeoDataFrame, points_from_xy
 
+try:
+    import wkbparse
+except ImportError:
+    wkbparse = None
+
+
+_HEX_DIGITS = '0123456789abcdefABCDEF'
+_SRID_REGEXP = re.compile(r'^SRID=(\d+);(.*)$')
 
 ENC_SHAPELY = 'shapely'
 ENC_WKB = 'wkb'
@@ -131,7 +139,17 @@ def decode_geometry(geom_col):
         if any(geom_col):
             first_geom = next(item for item in geom_col if item is not None)
             enc_type = detect_encoding_type(first_geom)
-        return GeoSeries(geom_col.apply(lambda g: decode_geometry_item(g, enc_type)))
+
+        # Resolve the loader once for the whole column, instead of
+        # re-dispatching on the encoding for every single geometry
+        load_func = _get_load_function(enc_type)
+
+        def decode(geom):
+            if geom:
+                return load_func(geom)
+            return shapely.geometry.base.BaseGeometry()
+
+        return GeoSeries(geom_col.apply(decode))
     else:
         return geom_col
 
@@ -173,21 +191,23 @@ def detect_encoding_type(input_geom):
     return None
 
 
+def _get_load_function(enc_type):
+    """Return the loader for a geometry encoding."""
+    return _LOAD_FUNCTIONS.get(enc_type, _load_shapely)
+
+
 def decode_geometry_item(geom, enc_type):
     """Decode any geometry into a shapely geometry."""
     if geom:
-        func = {
-            ENC_SHAPELY: lambda: geom,
-            ENC_WKB: lambda: _load_wkb(geom),
-            ENC_WKB_HEX: lambda: _load_wkb_hex(geom),
-            ENC_WKB_BHEX: lambda: _load_wkb_bhex(geom),
-            ENC_WKT: lambda: _load_wkt(geom),
-            ENC_EWKT: lambda: _load_ewkt(geom)
-        }.get(enc_type)
-        return func() if func else geom
+        return _get_load_function(enc_type)(geom)
     return shapely.geometry.base.BaseGeometry()
 
 
+def _load_shapely(geom):
+    """Passthrough for geometries that are already decoded."""
+    return geom
+
+
 def _load_wkb(geom):
     """Load WKB or EWKB geometry."""
     return shapely.wkb.loads(geom)
@@ -222,17 +242,31 @@ def _load_ewkt(egeom):
 
 
 def _is_hex(input_geom):
-    return re.match(r'^[0-9a-fA-F]+$', input_geom)
+    # A non-empty string is hex iff stripping hex digits leaves nothing;
+    # str.strip runs the scan in C without the regex machinery
+    return bool(input_geom) and not input_geom.strip(_HEX_DIGITS)
 
 
 def _extract_srid(egeom):
-    result = re.match(r'^SRID=(\d+);(.*)$', egeom)
+    result = _SRID_REGEXP.match(egeom)
     if result:
         return (result.group(1), result.group(2))
     else:
         return (0, egeom)
 
 
+# Built once at import time so dispatching on the encoding is a single
+# dict lookup instead of a dict allocation per call
+_LOAD_FUNCTIONS = {
+    ENC_SHAPELY: _load_shapely,
+    ENC_WKB: _load_wkb,
+    ENC_WKB_HEX: _load_wkb_hex,
+    ENC_WKB_BHEX: _load_wkb_bhex,
+    ENC_WKT: _load_wkt,
+    ENC_EWKT: _load_ewkt
+}
+
+
 def encode_geometry_ewkt(geom, srid=4326):
     if isinstance(geom, shapely.geometry.base.BaseGeometry):
         return 'SRID={0};{1}'.format(srid, geom.wkt)
@@ -246,4 +280,19 @@ def encode_geometry_ewkb(geom, srid=4326):
 
 def to_geojson(geom):
     if geom is not None and str(geom) != 'GEOMETRYCOLLECTION EMPTY':
-        return json.dumps(shapely.geometry.mapping(geom), sort_keys=True)
+        return json.dumps(_to_geojson_mapping(geom), sort_keys=True, separators=(',', ':'))
+
+
+def _to_geojson_mapping(geom):
+    if wkbparse is not None:
+        # When the Rust decoder is available, go through WKB so the
+        # coordinates are walked in native code instead of the Python-level
+        # recursion done by shapely.geometry.mapping
+        try:
+            mapping = wkbparse.ewkb_to_geojson(geom.wkb)
+            mapping.pop('crs', None)
+            return mapping
+        except ValueError:
+            # Some types (e.g. GeometryCollection) are not supported
+            pass
+    return shapely.geometry.mapping(geom)
@@ -1,5 +1,6 @@
 """general utility functions"""
 
+import io
 import os
 import re
 import gzip
@@ -16,7 +17,7 @@ import numpy as np
 import pkg_resources
 import semantic_version
 
-from functools import wraps
+from functools import lru_cache, wraps
 from datetime import datetime, timezone
 from warnings import catch_warnings, filterwarnings
 from pyrestcli.exceptions import ServerErrorException
@@ -34,15 +35,18 @@ PG_NULL = '__null'
 USER_CONFIG_DIR = appdirs.user_config_dir('cartoframes')
 
 
+_GEOM_TYPE_MAPPING = {
+    'Point': GEOM_TYPE_POINT,
+    'MultiPoint': GEOM_TYPE_POINT,
+    'LineString': GEOM_TYPE_LINE,
+    'MultiLineString': GEOM_TYPE_LINE,
+    'Polygon': GEOM_TYPE_POLYGON,
+    'MultiPolygon': GEOM_TYPE_POLYGON
+}
+
+
 def map_geom_type(geom_type):
-    return {
-        'Point': GEOM_TYPE_POINT,
-        'MultiPoint': GEOM_TYPE_POINT,
-        'LineString': GEOM_TYPE_LINE,
-        'MultiLineString': GEOM_TYPE_LINE,
-        'Polygon': GEOM_TYPE_POLYGON,
-        'MultiPolygon': GEOM_TYPE_POLYGON
-    }[geom_type]
+    return _GEOM_TYPE_MAPPING[geom_type]
 
 
 def dict_items(indict):
@@ -109,39 +113,42 @@ def temp_ignore_warnings(func):
     return wrapper
 
 
+_DTYPE_TO_PGTYPE = {
+    'int16': 'smallint',
+    'int32': 'integer',
+    'int64': 'bigint',
+    'float32': 'real',
+    'float64': 'double precision',
+    'object': 'text',
+    'bool': 'boolean',
+    'datetime64[ns]': 'timestamp',
+    'datetime64[ns, UTC]': 'timestamp',
+}
+
+_PGTYPE_TO_DTYPE = {
+    'smallint': 'int16', 'int2': 'int16',
+    'integer': 'int32', 'int4': 'int32', 'int': 'int32',
+    'bigint': 'int64', 'int8': 'int64',
+    'real': 'float32', 'float4': 'float32',
+    'double precision': 'float64', 'float8': 'float64',
+    'numeric': 'float64', 'decimal': 'float64',
+    'text': 'object',
+    'boolean': 'bool', 'bool': 'bool',
+    'date': 'datetime64[D]',
+    'timestamp': 'datetime64[ns]', 'timestamp without time zone': 'datetime64[ns]',
+    'timestampz': 'datetime64[ns]', 'timestamp with time zone': 'datetime64[ns]',
+    'USER-DEFINED': 'object',
+}
+
+
 def dtypes2pg(dtype):
     """Returns equivalent PostgreSQL type for input `dtype`"""
-    mapping = {
-        'int16': 'smallint',
-        'int32': 'integer',
-        'int64': 'bigint',
-        'float32': 'real',
-        'float64': 'double precision',
-        'object': 'text',
-        'bool': 'boolean',
-        'datetime64[ns]': 'timestamp',
-        'datetime64[ns, UTC]': 'timestamp',
-    }
-    return mapping.get(str(dtype), 'text')
+    return _DTYPE_TO_PGTYPE.get(str(dtype), 'text')
 
 
 def pg2dtypes(pgtype):
     """Returns equivalent dtype for input `pgtype`."""
-    mapping = {
-        'smallint': 'int16', 'int2': 'int16',
-        'integer': 'int32', 'int4': 'int32', 'int': 'int32',
-        'bigint': 'int64', 'int8': 'int64',
-        'real': 'float32', 'float4': 'float32',
-        'double precision': 'float64', 'float8': 'float64',
-        'numeric': 'float64', 'decimal': 'float64',
-        'text': 'object',
-        'boolean': 'bool', 'bool': 'bool',
-        'date': 'datetime64[D]',
-        'timestamp': 'datetime64[ns]', 'timestamp without time zone': 'datetime64[ns]',
-        'timestampz': 'datetime64[ns]', 'timestamp with time zone': 'datetime64[ns]',
-        'USER-DEFINED': 'object',
-    }
-    return mapping.get(str(pgtype), 'object')
+    return _PGTYPE_TO_DTYPE.get(str(pgtype), 'object')
 
 
 def gen_variable_name(value):
@@ -169,15 +176,19 @@ def text_match(regex, text):
 
 
 def camel_dictionary(dictionary):
-    snake_keys = filter(in_snake_case, dictionary.keys())
+    converted = {
+        snake_to_camel(key) if in_snake_case(key) else key: value
+        for key, value in dictionary.items()
+    }
 
-    for snake_key in list(snake_keys):
-        dictionary[snake_to_camel(snake_key)] = dictionary.pop(snake_key)
+    dictionary.clear()
+    dictionary.update(converted)
 
     return dictionary
 
 
 # https://stackoverflow.com/questions/19053707/converting-snake-case-to-lower-camel-case-lowercamelcase
+@lru_cache(maxsize=None)
 def snake_to_camel(snake_str):
     components = snake_str.split('_')
     # We capitalize the first letter of each component except the first one
@@ -260,15 +271,36 @@ def get_geodataframe_geom_type(gdf):
 
 def get_geodataframe_data(data, encode_data=True):
     filtered_geometries = _filter_null_geometries(data)
-    data = _set_time_cols_epoc(filtered_geometries).to_json(cls=CustomJSONEncoder, separators=(',', ':'))
+
+    time_columns = filtered_geometries.select_dtypes(include=_TIME_DTYPES).columns
+    if len(time_columns) > 0:
+        # Copy explicitly once before mutating: assigning into the filtered view
+        # would trigger pandas' hidden copy-on-write and double peak memory
+        filtered_geometries = filtered_geometries.copy()
+        for column in time_columns:
+            filtered_geometries[column] = filtered_geometries[column].astype(np.int64)
+
+    data = filtered_geometries.to_json(cls=CustomJSONEncoder, separators=(',', ':'))
 
     if (encode_data):
-        compressed_data = gzip.compress(data.encode('utf-8'))
-        return base64.b64encode(compressed_data).decode('utf-8')
+        return _compress_data(data)
     else:
         return data
 
 
+_COMPRESS_CHUNK_SIZE = 1 << 20
+
+
+def _compress_data(data):
+    """Gzip a string encoding it in chunks, so the full utf-8 bytestring
+    is never materialized next to the original string."""
+    buffer = io.BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode='wb') as compressed:
+        for start in range(0, len(data), _COMPRESS_CHUNK_SIZE):
+            compressed.write(data[start:start + _COMPRESS_CHUNK_SIZE].encode('utf-8'))
+    return base64.b64encode(buffer.getbuffer()).decode('utf-8')
+
+
 # Dup
 def _first_value(series):
     series = series.loc[~series.isnull()]  # Remove null values
@@ -284,17 +316,11 @@ class CustomJSONEncoder(json.JSONEncoder):
         return super(CustomJSONEncoder, self).default(o)
 
 
-def _filter_null_geometries(data):
-    return data[~data.geometry.isna()]
-
-
-def _set_time_cols_epoc(geometries):
-    include = ['datetimetz', 'datetime', 'timedelta']
+_TIME_DTYPES = ['datetimetz', 'datetime', 'timedelta']
 
-    for column in geometries.select_dtypes(include=include).columns:
-        geometries[column] = geometries[column].astype(np.int64)
 
-    return geometries
+def _filter_null_geometries(data):
+    return data[~data.geometry.isna()]
 
 
 def is_sql_query(data):
@@ -397,14 +423,17 @@ def create_hash(value):
     return hashlib.md5(str(value).encode()).hexdigest()
 
 
+_VIZ_COLUMN_REGEXP = re.compile(r'\$([A-Za-z0-9_]+)')
+_COMMENTS_REGEXP = re.compile(
+    r'//.*?$|/\*.*?\*/|\'(?:\\.|[^\\\'])*\'|"(?:\\.|[^\\"])*"',
+    re.DOTALL | re.MULTILINE
+)
+
+
 def extract_viz_columns(viz):
     """Extract columns ($name) in viz"""
-    columns = []
     viz_nocomments = remove_comments(viz)
-    viz_columns = re.findall(r'\$([A-Za-z0-9_]+)', viz_nocomments)
-    if viz_columns is not None:
-        columns += viz_columns
-    return list(set(columns))
+    return list(set(_VIZ_COLUMN_REGEXP.findall(viz_nocomments)))
 
 
 def remove_comments(text):
@@ -412,11 +441,7 @@ def remove_comments(text):
     def replacer(match):
         s = match.group(0)
         return ' ' if s.startswith('/') else s
-    pattern = re.compile(
-        r'//.*?$|/\*.*?\*/|\'(?:\\.|[^\\\'])*\'|"(?:\\.|[^\\"])*"',
-        re.DOTALL | re.MULTILINE
-    )
-    return re.sub(pattern, replacer, text).strip()
+    return _COMMENTS_REGEXP.sub(replacer, text).strip()
 
 
 def get_local_time():
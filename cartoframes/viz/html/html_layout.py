@@ -1,5 +1,3 @@
-from jinja2 import Environment, PackageLoader
-
 from .. import constants
 from . import utils
 
@@ -7,17 +5,10 @@ from . import utils
 class HTMLLayout(object):
     def __init__(self, template_path='templates/viz/layout.html.j2'):
         self.srcdoc = None
-        self._env = Environment(
-            loader=PackageLoader('cartoframes', 'assets'),
-            autoescape=True
-        )
-
-        self._env.filters['quot'] = utils.quote_filter
-        self._env.filters['iframe_size'] = utils.iframe_size_filter
-        self._env.filters['clear_none'] = utils.clear_none_filter
+        self._env = utils.get_template_env()
 
         self.html = None
-        self._template = self._env.get_template(template_path)
+        self._template = utils.get_template(template_path)
 
     def set_content(self, maps, size=None, show_info=None, theme=None, _carto_vl_path=None,
                     _airship_path=None, title='CARTOframes', is_embed=False,
@@ -1,7 +1,5 @@
 from warnings import warn
 
-from jinja2 import Environment, PackageLoader
-
 from .. import constants
 from ..basemaps import Basemaps
 from . import utils
@@ -12,17 +10,10 @@ class HTMLMap(object):
         self.width = None
         self.height = None
         self.srcdoc = None
-        self._env = Environment(
-            loader=PackageLoader('cartoframes', 'assets'),
-            autoescape=True
-        )
-
-        self._env.filters['quot'] = utils.quote_filter
-        self._env.filters['iframe_size'] = utils.iframe_size_filter
-        self._env.filters['clear_none'] = utils.clear_none_filter
+        self._env = utils.get_template_env()
 
         self.html = None
-        self._template = self._env.get_template(template_path)
+        self._template = utils.get_template(template_path)
 
     def set_content(
             self, size, layers, bounds, camera=None, basemap=None, show_info=None,
@@ -82,8 +73,7 @@ class HTMLMap(object):
             airship_styles_path = _airship_path + constants.AIRSHIP_STYLES_DEV
             airship_icons_path = _airship_path + constants.AIRSHIP_ICONS_DEV
 
-        has_legends = any(layer['legends'] for layer in layers)
-        has_widgets = any(len(layer['widgets']) != 0 for layer in layers)
+        has_legends, has_widgets = utils.get_content_flags(layers)
 
         return self._template.render(
             width=size[0] if size is not None else None,
@@ -1,13 +1,88 @@
 """general utility functions for HTML Map templates"""
 
+import json
+
+from functools import lru_cache
+
+from jinja2 import Environment, PackageLoader
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _orjson_dumps(obj, **kwargs):
+    # orjson is always compact; OPT_SORT_KEYS matches the stdlib policy below
+    try:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode('utf-8')
+    except TypeError:
+        # orjson is stricter about input types than the stdlib encoder
+        return json.dumps(obj, **kwargs)
+
+
+@lru_cache(maxsize=1)
+def get_template_env():
+    """Return a shared jinja2 environment for the HTML templates.
+
+    The environment is built once and reused, so templates are read from disk
+    and compiled only the first time they are rendered.
+    """
+    env = Environment(
+        loader=PackageLoader('cartoframes', 'assets'),
+        autoescape=True
+    )
+
+    # Compact separators: the |tojson-ed layer payloads end up inlined in the
+    # notebook HTML, so the default ', '/': ' padding is pure output size
+    env.policies['json.dumps_kwargs'] = {'sort_keys': True, 'separators': (',', ':')}
+
+    if orjson is not None:
+        # Serialize the payloads in C when orjson is available
+        env.policies['json.dumps_function'] = _orjson_dumps
+
+    env.filters['quot'] = quote_filter
+    env.filters['iframe_size'] = iframe_size_filter
+    env.filters['clear_none'] = clear_none_filter
+
+    return env
+
+
+@lru_cache(maxsize=None)
+def get_template(template_path):
+    """Return the compiled template for a path, reusing it across instances.
+
+    Templates (including the iframe base they extend) are compiled the first
+    time a path is requested and shared afterwards.
+    """
+    return get_template_env().get_template(template_path)
+
+
+def get_content_flags(layers):
+    """Compute the has_legends/has_widgets flags in a single pass over the layers."""
+    has_legends = False
+    has_widgets = False
+
+    for layer in layers:
+        has_legends = has_legends or bool(layer['legends'])
+        has_widgets = has_widgets or len(layer['widgets']) != 0
+        if has_legends and has_widgets:
+            break
+
+    return has_legends, has_widgets
+
+
+_DOUBLE_QUOTES_TRANSLATION = str.maketrans({'"': '&quot;'})
+_ALL_QUOTES_TRANSLATION = str.maketrans({'"': '&quot;', "'": "&#92;'"})
+
 
 def safe_quotes(text, escape_single_quotes=False):
     """htmlify string"""
     if isinstance(text, str):
-        safe_text = text.replace('"', "&quot;")
-        if escape_single_quotes:
-            safe_text = safe_text.replace("'", "&#92;'")
-        return safe_text.replace('True', 'true')
+        # One translate scan replaces both quote kinds instead of one
+        # str.replace pass per character
+        table = _ALL_QUOTES_TRANSLATION if escape_single_quotes else _DOUBLE_QUOTES_TRANSLATION
+        return text.translate(table).replace('True', 'true')
     return text
 
 
@@ -36,9 +36,13 @@ class KuvizPublisher:
 
         self._layers = []
         for layer in layers:
-            layer_copy = copy.deepcopy(layer)
+            # A shallow copy is enough: only the credentials dict is mutated,
+            # so it is the only attribute that needs to be detached. deepcopy
+            # would clone the whole source graph (dataframes, SQL clients)
+            layer_copy = copy.copy(layer)
 
             if layer_copy.credentials is not None:
+                layer_copy.credentials = dict(layer_copy.credentials)
                 if layer_copy.source.is_public():
                     layer_copy.credentials['api_key'] = maps_api_key or DEFAULT_PUBLIC
                 else:
@@ -5,6 +5,7 @@ from warnings import warn
 
 from . import constants
 from .html import HTMLMap
+from .html.utils import get_content_flags
 from .basemaps import Basemaps
 from .kuviz import KuvizPublisher
 from ..utils.utils import get_center, get_credentials
@@ -158,8 +159,7 @@ class Map:
         return self._html_map.html
 
     def get_content(self):
-        has_legends = any(layer['legends'] for layer in self.layer_defs)
-        has_widgets = any(len(layer['widgets']) != 0 for layer in self.layer_defs)
+        has_legends, has_widgets = get_content_flags(self.layer_defs)
 
         return {
             'layers': self.layer_defs,
@@ -364,28 +364,19 @@ def _conv2nan(val):
 
 
 def _compute_bounds(layers):
-    init_bounds = None
-    if layers is not None and len(layers) > 0:
-        init_bounds = layers[0].bounds
+    if layers is None or len(layers) == 0:
+        return _format_bounds(None)
 
-    bounds = _format_bounds(init_bounds)
+    if len(layers) == 1:
+        return _format_bounds(layers[0].bounds)
 
-    for layer in layers[1:]:
-        layer_bounds = _format_bounds(layer.bounds)
+    # Stack all the layer bounds into one (N, 2, 2) array and reduce it
+    # in a single vectorized min/max pass instead of comparing layer by layer
+    arr = np.asarray([_format_bounds(layer.bounds) for layer in layers], dtype=np.float64)
 
-        if layer_bounds[0][0] < bounds[0][0]:
-            bounds[0][0] = layer_bounds[0][0]
-
-        if layer_bounds[0][1] < bounds[0][1]:
-            bounds[0][1] = layer_bounds[0][1]
-
-        if layer_bounds[1][0] > bounds[1][0]:
-            bounds[1][0] = layer_bounds[1][0]
-
-        if layer_bounds[1][1] > bounds[1][1]:
-            bounds[1][1] = layer_bounds[1][1]
-
-    return bounds
+    # tolist() returns plain Python floats, so downstream comparisons and
+    # formatting do not pay the numpy scalar dispatch overhead
+    return [arr[:, 0].min(axis=0).tolist(), arr[:, 1].max(axis=0).tolist()]
 
 
 def _get_theme(theme, basemap):
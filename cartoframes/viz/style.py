@@ -1,5 +1,12 @@
+import re
+
 from . import defaults
-from ..utils.utils import merge_dicts, text_match
+from ..utils.utils import merge_dicts
+
+_PRUNABLE_PROPERTY_REGEXES = {
+    prop: re.compile(r'{}\s*:'.format(prop), re.MULTILINE)
+    for prop in ('color', 'width', 'strokeColor', 'strokeWidth')
+}
 
 
 class Style:
@@ -8,6 +15,7 @@ class Style:
                  default_legend=None, default_widget=None,
                  default_popup_hover=None, default_popup_click=None):
         self._style = self._init_style(data=data)
+        self._compiled_cache = {}
         self._value = value
         self._default_legend = default_legend
         self._default_widget = default_widget
@@ -43,19 +51,29 @@ class Style:
         return self._default_popup_click
 
     def compute_viz(self, geom_type, variables={}):
+        # The style itself is immutable, so the serialized viz only depends
+        # on the geometry type and the external variables. Cache it to make
+        # re-rendering the same Style instance free
+        cache_key = (geom_type, tuple(sorted(variables.items())))
+        if cache_key in self._compiled_cache:
+            return self._compiled_cache[cache_key]
+
         style = self._style
         default_style = defaults.STYLE[geom_type]
 
         if isinstance(style, str):
             # Only for testing purposes
-            return self._parse_style_str(style, default_style, variables)
+            viz = self._parse_style_str(style, default_style, variables)
         elif isinstance(style, dict):
             if geom_type in style:
                 style = style.get(geom_type)
-            return self._parse_style_dict(style, default_style, variables)
+            viz = self._parse_style_dict(style, default_style, variables)
         else:
             raise ValueError('`style` must be a dictionary')
 
+        self._compiled_cache[cache_key] = viz
+        return viz
+
     def _parse_style_dict(self, style, default_style, ext_vars):
         variables = merge_dicts(style.get('vars', {}), ext_vars)
         properties = merge_dicts(default_style, style)
@@ -75,33 +93,21 @@ class Style:
         return serialized_variables + serialized_default_properties + style
 
     def _serialize_variables(self, variables={}):
-        output = ''
-        for var in variables:
-            output += '@{name}: {value}\n'.format(
-                name=var,
-                value=variables.get(var)
-            )
-        return output
+        return ''.join(
+            '@{name}: {value}\n'.format(name=var, value=value)
+            for var, value in variables.items()
+        )
 
     def _serialize_properties(self, properties={}):
-        output = ''
-        for prop in properties:
-            if prop == 'vars':
-                continue
-            output += '{name}: {value}\n'.format(
-                name=prop,
-                value=properties.get(prop)
-            )
-        return output
+        return ''.join(
+            '{name}: {value}\n'.format(name=prop, value=value)
+            for prop, value in properties.items()
+            if prop != 'vars'
+        )
 
     def _prune_defaults(self, default_style, style):
         output = default_style.copy()
-        if 'color' in output and text_match(r'color\s*:', style):
-            del output['color']
-        if 'width' in output and text_match(r'width\s*:', style):
-            del output['width']
-        if 'strokeColor' in output and text_match(r'strokeColor\s*:', style):
-            del output['strokeColor']
-        if 'strokeWidth' in output and text_match(r'strokeWidth\s*:', style):
-            del output['strokeWidth']
+        for prop, regex in _PRUNABLE_PROPERTY_REGEXES.items():
+            if prop in output and regex.search(style):
+                del output[prop]
         return output
@@ -13,6 +13,9 @@ class ResponseMock(list):
         super(ResponseMock, self).__init__(data, **kwargs)
         self.total_rows = len(data)
 
+    def to_dataframe(self):
+        return pd.DataFrame(list(self))
+
 
 class QueryJobMock(object):
     def __init__(self, response):
@@ -69,7 +72,7 @@ class TestBigQueryClient(object):
         columns = ['column1', 'column2']
 
         column_names_mock.return_value = Mock(return_value=columns)
-        download_mock.return_value = data
+        download_mock.return_value = ResponseMock(data)
 
         expected_df = pd.DataFrame(data, columns=columns)
 
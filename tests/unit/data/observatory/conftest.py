@@ -0,0 +1,14 @@
+import pytest
+
+from cartoframes.data.observatory.catalog.repository.dataset_repo import get_dataset_repo
+from cartoframes.data.observatory.catalog.repository.geography_repo import get_geography_repo
+from cartoframes.data.observatory.catalog.repository.provider_repo import get_provider_repo
+
+
+@pytest.fixture(autouse=True)
+def clean_repo_caches():
+    """The repositories are singletons that memoize entity lookups,
+    so their caches must be cleaned between tests."""
+    get_dataset_repo()._cached_entities.clear()
+    get_geography_repo()._cached_entities.clear()
+    get_provider_repo()._cached_entities.clear()
@@ -1,12 +1,16 @@
 import pytest
 
+from io import BytesIO
+from math import isinf, isnan
+
 from carto.sql import SQLClient, BatchSQLClient, CopySQLClient
 
 from pandas import DataFrame
 from geopandas import GeoDataFrame
 from cartoframes.auth import Credentials
 from cartoframes.io.managers.context_manager import ContextManager
-from cartoframes.utils.columns import ColumnInfo
+from cartoframes.utils.columns import Column, ColumnInfo
+from cartoframes.utils.geom_utils import decode_geometry
 
 
 class TestContextManager(object):
@@ -105,11 +109,46 @@ class TestContextManager(object):
         assert mock.call_args[0][0] == '''
             COPY table_name(a,b) FROM stdin WITH (FORMAT csv, DELIMITER '|', NULL '__null');
         '''.strip()
-        assert list(mock.call_args[0][1]) == [
-            b'1|0101000020E610000000000000000000000000000000000000\n',
+        # Both rows fit in a single chunk
+        expected_chunk = (
+            b'1|0101000020E610000000000000000000000000000000000000\n'
             b'2|0101000020E6100000000000000000F03F000000000000F03F\n'
+        )
+        assert list(mock.call_args[0][1]) == [expected_chunk]
+
+    def test_internal_copy_to(self, mocker):
+        # Given
+        mocker.patch('cartoframes.io.managers.context_manager._create_auth_client')
+        raw_result = BytesIO(
+            b'the_geom,value,name\n'
+            b'__null,NaN,first\n'
+            b'0101000020E6100000000000000000F03F000000000000F03F,Infinity,NaN\n'
+        )
+        mocker.patch.object(CopySQLClient, 'copyto_stream', return_value=raw_result)
+        columns = [
+            Column('the_geom', normalize=False, pgtype='geometry'),
+            Column('value', normalize=False, pgtype='float8'),
+            Column('name', normalize=False, pgtype='text')
         ]
 
+        # When
+        cm = ContextManager(self.credentials)
+        df = cm._copy_to('query', columns, 0)
+
+        # Then
+        # A NULL geometry must surface as None, even in the first row,
+        # so decode_geometry detects the encoding from the second one
+        assert df['the_geom'][0] is None
+        assert df['the_geom'][1] == '0101000020E6100000000000000000F03F000000000000F03F'
+        assert decode_geometry(df['the_geom'])[1].wkt == 'POINT (1 1)'
+        # Float specials emitted by PostgreSQL must parse as floats,
+        # while a literal 'NaN' in a text column stays text
+        assert df['value'].dtype == 'float64'
+        assert isnan(df['value'][0])
+        assert isinf(df['value'][1])
+        assert df['name'][0] == 'first'
+        assert df['name'][1] == 'NaN'
+
     def test_rename_table(self, mocker):
         # Given
         def has_table(table_name):